@@ -17,13 +17,14 @@ from ..tools.testing_tools import TestingTools
 class MobileWebAgent:
     """Main orchestrator for autonomous mobile web development."""
 
-    def __init__(self, work_directory: str = ".", model: str = "qwen2.5-coder:7b", verbose: bool = True):
+    def __init__(self, work_directory: str = ".", model: str = "qwen2.5-coder:7b", verbose: bool = True,
+                 ollama: Optional[OllamaClient] = None):
         self.work_dir = Path(work_directory).resolve()
         self.model = model
         self.verbose = verbose
 
-        # Initialize core systems
-        self.ollama = OllamaClient()
+        # Initialize core systems (sub-agents reuse the parent's client and connection)
+        self.ollama = ollama or OllamaClient()
         self.ollama.set_model(model)
 
         self.file_ops = FileOperations(self.work_dir)
@@ -187,6 +188,17 @@ Start by understanding the current directory state, create tasks for the goal, t
                 print(f"Raw response: {raw}")
             return {"action": "ERROR", "args": {"message": f"Failed to parse JSON: {e}"}}
 
+    @staticmethod
+    def record_exchange(history: list, assistant_content: str, tool_content: str) -> None:
+        """Append an assistant/tool exchange to history unless it repeats the previous one."""
+        exchange = [
+            {"role": "assistant", "content": assistant_content},
+            {"role": "tool", "content": tool_content}
+        ]
+        # A stuck agent tends to repeat the same response and error; keep the prompt dense
+        if history[-2:] != exchange:
+            history.extend(exchange)
+
     def run_agent(self, user_goal: str, max_steps: int = 30) -> str:
         """Run the autonomous mobile web agent."""
         if self.verbose:
@@ -229,15 +241,13 @@ Start by understanding the current directory state, create tasks for the goal, t
             if not isinstance(action, dict) or "action" not in action:
                 if self.verbose:
                     print(f"❌ Invalid response format: {raw_resp}")
-                history.append({"role": "assistant", "content": raw_resp})
-                history.append({"role": "tool", "content": "Response must be valid JSON with 'action' field."})
+                self.record_exchange(history, raw_resp, "Response must be valid JSON with 'action' field.")
                 continue
 
             if action["action"] == "ERROR":
                 if self.verbose:
                     print(f"❌ JSON Error: {action.get('args', {}).get('message', 'Unknown error')}")
-                history.append({"role": "assistant", "content": raw_resp})
-                history.append({"role": "tool", "content": "JSON parsing failed. Please provide valid JSON."})
+                self.record_exchange(history, raw_resp, "JSON parsing failed. Please provide valid JSON.")
                 continue
 
             if action["action"] == "DONE":
@@ -254,8 +264,7 @@ Start by understanding the current directory state, create tasks for the goal, t
                 error_msg = f"Unknown tool: {tool_name}. Available: {list(self.tools.keys())}"
                 if self.verbose:
                     print(f"❌ {error_msg}")
-                history.append({"role": "assistant", "content": raw_resp})
-                history.append({"role": "tool", "content": error_msg})
+                self.record_exchange(history, raw_resp, error_msg)
                 continue
 
             # Run tool
@@ -269,8 +278,7 @@ Start by understanding the current directory state, create tasks for the goal, t
                 if self.verbose:
                     print(f"❌ Tool error: {result}")
 
-            history.append({"role": "assistant", "content": raw_resp})
-            history.append({"role": "tool", "content": result})
+            self.record_exchange(history, raw_resp, result)
 
             # Reflection triggers (simplified for modular structure)
             should_reflect = False
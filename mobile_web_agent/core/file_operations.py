@@ -1,8 +1,9 @@
 """File and system operations for the Mobile Web Agent."""
 
 import subprocess
+import time
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 
 class FileOperations:
@@ -10,6 +11,8 @@ class FileOperations:
 
     def __init__(self, work_dir: Path):
         self.work_dir = work_dir
+        # Wall-clock time after which files may have changed; generated reports older than this are stale
+        self.last_modified = time.time()
 
     def read_file(self, path: str) -> str:
         """Read file contents relative to work directory."""
@@ -25,12 +28,32 @@ class FileOperations:
         try:
             full_path = self.work_dir / path
             full_path.parent.mkdir(parents=True, exist_ok=True)
+            self.last_modified = time.time()
             with open(full_path, "w", encoding="utf-8") as f:
                 f.write(contents)
             return f"Successfully wrote {len(contents)} characters to {path}"
         except Exception as e:
             return f"ERROR: {e}"
 
+    def write_files(self, files: List[Tuple[str, str]]) -> str:
+        """Write several files relative to work directory, one result line per file."""
+        results = []
+        created_dirs = set()
+        self.last_modified = time.time()
+        for path, contents in files:
+            try:
+                full_path = self.work_dir / path
+                # Sibling files share a parent; only create each directory once
+                if full_path.parent not in created_dirs:
+                    full_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(full_path.parent)
+                with open(full_path, "w", encoding="utf-8") as f:
+                    f.write(contents)
+                results.append(f"Successfully wrote {len(contents)} characters to {path}")
+            except Exception as e:
+                results.append(f"ERROR: {e}")
+        return "\n".join(results)
+
     def edit_file(self, path: str, line_range: str, new_text: str) -> str:
         """Edit specific lines in a file."""
         try:
@@ -48,6 +71,7 @@ class FileOperations:
 
             lines[start_idx:end_idx] = [new_text + "\n" if not new_text.endswith("\n") else new_text]
 
+            self.last_modified = time.time()
             with open(full_path, "w", encoding="utf-8") as f:
                 f.writelines(lines)
             return f"Successfully edited lines {start}:{end} in {path}"
@@ -84,6 +108,8 @@ class FileOperations:
 
         try:
             full_cwd = self.work_dir / cwd
+            # Shell commands (cp, mv, npm, ...) may change files
+            self.last_modified = time.time()
             result = subprocess.run(
                 cmd,
                 shell=True,
@@ -48,8 +48,7 @@ CURRENT PROJECT STATE:
 
 NEXT PRIORITIES:
 """
-            for i, priority in enumerate(next_priorities[:5], 1):
-                reflection += f"{i}. {priority}\n"
+            reflection += "".join(f"{i}. {priority}\n" for i, priority in enumerate(next_priorities[:5], 1))
 
             reflection += f"""
 ASSESSMENT QUESTIONS:
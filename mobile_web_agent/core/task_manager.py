@@ -9,6 +9,8 @@ class TaskManager:
     def __init__(self):
         self.tasks: List[Dict[str, Any]] = []
         self.task_counter = 0
+        # id -> task, so status changes don't scan the whole task list
+        self._task_index: Dict[int, Dict[str, Any]] = {}
 
     def create_task(self, description: str, priority: str = "medium") -> str:
         """Create a new task with description and priority."""
@@ -20,6 +22,7 @@ class TaskManager:
             "priority": priority
         }
         self.tasks.append(task)
+        self._task_index[task["id"]] = task
         return f"Created task #{self.task_counter}: {description}"
 
     def list_tasks(self) -> str:
@@ -27,14 +30,17 @@ class TaskManager:
         if not self.tasks:
             return "No tasks created yet"
 
-        result = "Current Tasks:\n" + "=" * 40 + "\n"
-        for task in self.tasks:
-            status_icon = {
-                "pending": "☐",
-                "in_progress": "🔄",
-                "completed": "✅"
-            }.get(task["status"], "❓")
-            result += f"{status_icon} #{task['id']}: {task['description']} [{task['status']}]\n"
+        status_icons = {
+            "pending": "☐",
+            "in_progress": "🔄",
+            "completed": "✅"
+        }
+        lines = ["Current Tasks:", "=" * 40]
+        lines.extend(
+            f"{status_icons.get(task['status'], '❓')} #{task['id']}: {task['description']} [{task['status']}]"
+            for task in self.tasks
+        )
+        result = "\n".join(lines) + "\n"
 
         pending = len([t for t in self.tasks if t["status"] == "pending"])
         in_progress = len([t for t in self.tasks if t["status"] == "in_progress"])
@@ -46,12 +52,11 @@ class TaskManager:
     def complete_task(self, task_id: str) -> str:
         """Mark a task as completed."""
         try:
-            task_id_int = int(task_id)
-            for task in self.tasks:
-                if task["id"] == task_id_int:
-                    task["status"] = "completed"
-                    return f"✅ Completed task #{task_id}: {task['description']}"
-            return f"ERROR: Task #{task_id} not found"
+            task = self._task_index.get(int(task_id))
+            if task is None:
+                return f"ERROR: Task #{task_id} not found"
+            task["status"] = "completed"
+            return f"✅ Completed task #{task_id}: {task['description']}"
         except ValueError:
             return f"ERROR: Invalid task ID '{task_id}'. Use a number."
 
@@ -62,12 +67,11 @@ class TaskManager:
             return f"ERROR: Invalid status '{status}'. Use: {', '.join(valid_statuses)}"
 
         try:
-            task_id_int = int(task_id)
-            for task in self.tasks:
-                if task["id"] == task_id_int:
-                    old_status = task["status"]
-                    task["status"] = status
-                    return f"Updated task #{task_id} from '{old_status}' to '{status}'"
-            return f"ERROR: Task #{task_id} not found"
+            task = self._task_index.get(int(task_id))
+            if task is None:
+                return f"ERROR: Task #{task_id} not found"
+            old_status = task["status"]
+            task["status"] = status
+            return f"Updated task #{task_id} from '{old_status}' to '{status}'"
         except ValueError:
             return f"ERROR: Invalid task ID '{task_id}'. Use a number."
\ No newline at end of file
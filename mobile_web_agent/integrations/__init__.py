@@ -1,6 +1,6 @@
 """Integration modules for external services."""
 
 # Import existing integrations
-from .ollama_client import OllamaClient
+from .ollama_client import OllamaClient, AsyncOllamaClient, OllamaStreamError
 
-__all__ = ["OllamaClient"]
\ No newline at end of file
+__all__ = ["OllamaClient", "AsyncOllamaClient", "OllamaStreamError"]
\ No newline at end of file
@@ -1,19 +1,197 @@
-import requests
-import json
-from typing import Dict, Any, Optional
+import hashlib
+import os
+import re
+import sqlite3
+import time
+import diskcache
+import httpx
+import orjson
+from typing import Dict, Any, Iterator, List, Optional, Union
 
-class OllamaClient:
-    """Client for communicating with local Ollama models."""
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Deterministic (temperature 0.0) completions are cached on disk for a week
+RESPONSE_CACHE_DIR = os.path.expanduser("~/.cache/ollama_client")
+RESPONSE_CACHE_TTL = 7 * 86400
+
+# Keep-alive pool shared by every request a client makes
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=8, max_connections=16)
+
+# Keep the model resident between sparse agent calls instead of reloading it each time
+KEEP_ALIVE = "10m"
+
+# Fast path for /api/generate stream lines: pull the raw "response" bytes without a JSON decode
+_RESPONSE_FIELD = re.compile(rb'"response":"((?:[^"\\]|\\.)*)"')
+_DONE_MARKER = b'"done":true'
+_ERROR_MARKER = b'"error"'
+
+
+class OllamaStreamError(RuntimeError):
+    """Raised when a streamed Ollama response reports an error or ends before "done"."""
+
+
+class _BaseOllamaClient:
+    """State and request building shared by the sync and async Ollama clients."""
 
     def __init__(self, base_url: str = "http://localhost:11434"):
         self.base_url = base_url
         self.model = "qwen2.5-coder:7b"  # Default model
 
+        # Short-lived cache of /api/tags so back-to-back model/health checks share one request
+        self._tags_cache: Optional[List[str]] = None
+        self._tags_set: frozenset = frozenset()
+        self._tags_cache_ts = 0.0
+        self._tags_ttl = 5.0
+
+        # Opened on the first cacheable call; False once it has failed to open
+        self._cache: Any = None
+
     def set_model(self, model_name: str) -> None:
         """Set the model to use for completions."""
         self.model = model_name
 
-    def generate(self, prompt: str, system_prompt: str = "", max_tokens: int = 1000, temperature: float = 0.0) -> str:
+    def _cache_key(self, endpoint: str, *parts: Any) -> str:
+        """Hash the model, endpoint and request inputs into a response cache key."""
+        raw = "\x00".join([self.model, endpoint, *map(str, parts)])
+        return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _generate_payload(self, prompt: str, system_prompt: str, max_tokens: int, temperature: float) -> Dict[str, Any]:
+        """Build a streaming /api/generate payload."""
+        # Sending the system prompt separately lets Ollama reuse its cached prefix across calls
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "system": system_prompt,
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": temperature,
+                "top_k": 40,
+                "top_p": 0.9,
+            }
+        }
+
+    def _chat_payload(self, messages: list, max_tokens: int, temperature: float) -> Dict[str, Any]:
+        """Build a streaming /api/chat payload."""
+        return {
+            "model": self.model,
+            "messages": messages,
+            "stream": True,
+            "keep_alive": KEEP_ALIVE,
+            "options": {
+                "num_predict": max_tokens,
+                "temperature": temperature,
+                "top_k": 40,
+                "top_p": 0.9,
+            }
+        }
+
+    def _response_cache(self) -> Optional[diskcache.Cache]:
+        """Open the on-disk response cache, or return None if it cannot be created."""
+        if self._cache is None:
+            try:
+                self._cache = diskcache.Cache(RESPONSE_CACHE_DIR)
+            except (OSError, sqlite3.Error):
+                self._cache = False
+        # An empty Cache is falsy (it defines __len__), so compare against the sentinel
+        return None if self._cache is False else self._cache
+
+    def _close_cache(self) -> None:
+        """Close the response cache if it was opened."""
+        if self._cache is not None and self._cache is not False:
+            self._cache.close()
+        self._cache = None
+
+    def _cached_response(self, endpoint: str, temperature: float, no_cache: bool, *parts: Any):
+        """Return (cache_key, cached_text); the key is None when caching does not apply."""
+        if temperature != 0.0 or no_cache:
+            return None, None
+        cache = self._response_cache()
+        if cache is None:
+            return None, None
+        cache_key = self._cache_key(endpoint, *parts)
+        return cache_key, cache.get(cache_key)
+
+    def _store_response(self, cache_key: Optional[str], result: str) -> str:
+        """Persist a completion under cache_key and return it.
+
+        Callers only reach this with text from a stream that ended in "done"
+        without an error, so partial completions are never cached.
+        """
+        if cache_key is not None:
+            try:
+                self._cache.set(cache_key, result, expire=RESPONSE_CACHE_TTL)
+            except (OSError, sqlite3.Error, diskcache.Timeout):
+                # A full disk or locked store must not turn a finished completion into an error
+                pass
+        return result
+
+    @staticmethod
+    def _decode_chunk(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        """Decode one NDJSON line from a streaming response; None for blank keep-alive lines."""
+        if not line:
+            return None
+        chunk = orjson.loads(line)
+        # Ollama reports failures after the stream has started as {"error": ...} with HTTP 200
+        if "error" in chunk:
+            raise OllamaStreamError(chunk["error"])
+        return chunk
+
+    @staticmethod
+    def _append_response(buf: bytearray, line: bytes) -> bool:
+        """Append the "response" text of one generate stream line to buf; return True once done."""
+        if not line.strip():
+            return False
+        match = _RESPONSE_FIELD.search(line)
+        if match is not None and b"\\" not in match.group(1) and _ERROR_MARKER not in line:
+            # No escapes: the JSON string body is already the UTF-8 text
+            buf.extend(match.group(1))
+            return _DONE_MARKER in line
+        chunk = _BaseOllamaClient._decode_chunk(line)
+        buf.extend(chunk.get("response", "").encode("utf-8"))
+        return bool(chunk.get("done"))
+
+
+class OllamaClient(_BaseOllamaClient):
+    """Client for communicating with local Ollama models."""
+
+    def __init__(self, base_url: str = "http://localhost:11434"):
+        super().__init__(base_url)
+        # Persistent client keeps the connection to Ollama alive across agent steps
+        self._client = httpx.Client(base_url=base_url, timeout=60.0, limits=_POOL_LIMITS)
+
+    def close(self) -> None:
+        """Close pooled connections to the Ollama server and the response cache."""
+        self._client.close()
+        self._close_cache()
+
+    def _iter_chunks(self, response: httpx.Response) -> Iterator[Dict[str, Any]]:
+        """Yield decoded NDJSON chunks from a streaming Ollama response until done."""
+        for line in response.iter_lines():
+            chunk = self._decode_chunk(line)
+            if chunk is None:
+                continue
+            yield chunk
+            if chunk.get("done"):
+                return
+        raise OllamaStreamError("stream ended before the response was complete")
+
+    def _generate_text(self, response: httpx.Response) -> str:
+        """Accumulate a streamed /api/generate body as bytes and decode it once."""
+        buf = bytearray()
+        pending = b""
+        for data in response.iter_bytes():
+            *lines, pending = (pending + data).split(b"\n")
+            for line in lines:
+                if self._append_response(buf, line):
+                    return buf.decode("utf-8").strip()
+        if self._append_response(buf, pending):
+            return buf.decode("utf-8").strip()
+        raise OllamaStreamError("stream ended before the response was complete")
+
+    def generate(self, prompt: str, system_prompt: str = "", max_tokens: int = 1000, temperature: float = 0.0,
+                 no_cache: bool = False) -> str:
         """
         Generate a completion using the local Ollama model.
 
@@ -21,122 +199,245 @@ class OllamaClient:
             prompt: The user prompt
             system_prompt: Optional system prompt
             max_tokens: Maximum tokens to generate
-            temperature: Temperature for generation (0.0 = deterministic)
+            temperature: Temperature for generation (0.0 = deterministic, cached on disk)
+            no_cache: Skip the on-disk response cache for this call
 
         Returns:
             Generated text response
         """
         try:
-            # Build the full prompt with system message if provided
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-
-            payload = {
-                "model": self.model,
-                "prompt": full_prompt,
-                "stream": False,
-                "options": {
-                    "num_predict": max_tokens,
-                    "temperature": temperature,
-                    "top_k": 40,
-                    "top_p": 0.9,
-                }
-            }
+            cache_key, cached = self._cached_response("generate", temperature, no_cache,
+                                                      system_prompt, prompt, max_tokens)
+            if cached is not None:
+                return cached
+
+            payload = self._generate_payload(prompt, system_prompt, max_tokens, temperature)
 
-            response = requests.post(
-                f"{self.base_url}/api/generate",
-                json=payload,
-                timeout=60
-            )
+            with self._client.stream("POST", "/api/generate", content=orjson.dumps(payload),
+                                     headers=_JSON_HEADERS) as response:
+                if response.status_code != 200:
+                    response.read()
+                    return f"ERROR: Ollama request failed with status {response.status_code}: {response.text}"
 
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("response", "").strip()
-            else:
-                return f"ERROR: Ollama request failed with status {response.status_code}: {response.text}"
+                # Consume tokens as the model produces them instead of waiting for the full body
+                result = self._generate_text(response)
 
-        except requests.exceptions.RequestException as e:
+            return self._store_response(cache_key, result)
+
+        except OllamaStreamError as e:
+            return f"ERROR: Ollama stream failed: {e}"
+        except httpx.HTTPError as e:
             return f"ERROR: Failed to connect to Ollama: {e}"
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             return f"ERROR: Failed to parse Ollama response: {e}"
         except Exception as e:
             return f"ERROR: Unexpected error: {e}"
 
-    def chat(self, messages: list, max_tokens: int = 1000, temperature: float = 0.0) -> str:
+    def generate_stream(self, prompt: str, system_prompt: str = "", max_tokens: int = 1000, temperature: float = 0.0) -> Iterator[str]:
+        """
+        Stream a completion from the local Ollama model piece by piece.
+
+        Unlike generate(), failures are raised (httpx.HTTPError,
+        orjson.JSONDecodeError or OllamaStreamError) rather than returned as
+        an ERROR string.
+
+        Yields:
+            Response text fragments in generation order
+        """
+        payload = self._generate_payload(prompt, system_prompt, max_tokens, temperature)
+
+        with self._client.stream("POST", "/api/generate", content=orjson.dumps(payload),
+                                 headers=_JSON_HEADERS) as response:
+            response.raise_for_status()
+            for chunk in self._iter_chunks(response):
+                yield chunk.get("response", "")
+
+    def chat(self, messages: list, max_tokens: int = 1000, temperature: float = 0.0, no_cache: bool = False) -> str:
         """
         Chat completion using Ollama's chat endpoint.
 
         Args:
             messages: List of message dicts with 'role' and 'content' keys
             max_tokens: Maximum tokens to generate
-            temperature: Temperature for generation
+            temperature: Temperature for generation (0.0 = deterministic, cached on disk)
+            no_cache: Skip the on-disk response cache for this call
 
         Returns:
             Generated response
         """
         try:
-            payload = {
-                "model": self.model,
-                "messages": messages,
-                "stream": False,
-                "options": {
-                    "num_predict": max_tokens,
-                    "temperature": temperature,
-                    "top_k": 40,
-                    "top_p": 0.9,
-                }
-            }
+            cache_key, cached = self._cached_response("chat", temperature, no_cache,
+                                                      orjson.dumps(messages).decode(), max_tokens)
+            if cached is not None:
+                return cached
+
+            payload = self._chat_payload(messages, max_tokens, temperature)
 
-            response = requests.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-                timeout=60
-            )
+            with self._client.stream("POST", "/api/chat", content=orjson.dumps(payload),
+                                     headers=_JSON_HEADERS) as response:
+                if response.status_code != 200:
+                    response.read()
+                    return f"ERROR: Ollama chat request failed with status {response.status_code}: {response.text}"
 
-            if response.status_code == 200:
-                result = response.json()
-                return result.get("message", {}).get("content", "").strip()
-            else:
-                return f"ERROR: Ollama chat request failed with status {response.status_code}: {response.text}"
+                parts = [chunk.get("message", {}).get("content", "") for chunk in self._iter_chunks(response)]
 
-        except requests.exceptions.RequestException as e:
+            return self._store_response(cache_key, "".join(parts).strip())
+
+        except OllamaStreamError as e:
+            return f"ERROR: Ollama stream failed: {e}"
+        except httpx.HTTPError as e:
             return f"ERROR: Failed to connect to Ollama: {e}"
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             return f"ERROR: Failed to parse Ollama response: {e}"
         except Exception as e:
             return f"ERROR: Unexpected error: {e}"
 
-    def check_model(self) -> bool:
-        """Check if the current model is available."""
+    def _get_tags(self) -> Optional[List[str]]:
+        """Return installed model names from /api/tags, cached for a few seconds."""
+        if self._tags_cache is not None and time.monotonic() - self._tags_cache_ts < self._tags_ttl:
+            return self._tags_cache
+
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                available_models = [model.get("name", "") for model in models]
-                return self.model in available_models
-            return False
+            response = self._client.get("/api/tags", timeout=10)
+            if response.status_code != 200:
+                return None
+            models = orjson.loads(response.content).get("models", [])
         except Exception:
-            return False
+            return None
+
+        self._tags_cache = [model.get("name", "") for model in models]
+        self._tags_set = frozenset(self._tags_cache)
+        self._tags_cache_ts = time.monotonic()
+        return self._tags_cache
+
+    def invalidate_tags(self) -> None:
+        """Drop the cached model list so the next lookup hits the server."""
+        self._tags_cache = None
+        self._tags_set = frozenset()
+        self._tags_cache_ts = 0.0
+
+    def _get_tags_set(self) -> Optional[frozenset]:
+        """Return installed model names as a frozenset for O(1) membership checks."""
+        return self._tags_set if self._get_tags() is not None else None
+
+    def check_model(self) -> bool:
+        """Check if the current model is available."""
+        tags_set = self._get_tags_set()
+        return tags_set is not None and self.model in tags_set
+
+    def check_models(self, names: List[str]) -> Dict[str, bool]:
+        """Check availability of several models with a single /api/tags lookup."""
+        tags_set = self._get_tags_set() or frozenset()
+        return {name: name in tags_set for name in names}
 
     def list_models(self) -> list:
         """List all available models."""
-        try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
-            if response.status_code == 200:
-                models = response.json().get("models", [])
-                return [model.get("name", "") for model in models]
-            return []
-        except Exception:
-            return []
+        return list(self._get_tags() or [])
 
     def health_check(self) -> bool:
         """Check if Ollama server is running and responsive."""
+        return self._get_tags() is not None
+
+
+class AsyncOllamaClient(_BaseOllamaClient):
+    """Asyncio client for issuing independent Ollama calls concurrently.
+
+    Example:
+        results = await asyncio.gather(client.generate(p1), client.generate(p2))
+    """
+
+    def __init__(self, base_url: str = "http://localhost:11434"):
+        super().__init__(base_url)
+        self._client = httpx.AsyncClient(base_url=base_url, timeout=60.0, limits=_POOL_LIMITS)
+
+    async def aclose(self) -> None:
+        """Close pooled connections to the Ollama server and the response cache."""
+        await self._client.aclose()
+        self._close_cache()
+
+    async def _generate_text(self, response: httpx.Response) -> str:
+        """Accumulate a streamed /api/generate body as bytes and decode it once."""
+        buf = bytearray()
+        pending = b""
+        async for data in response.aiter_bytes():
+            *lines, pending = (pending + data).split(b"\n")
+            for line in lines:
+                if self._append_response(buf, line):
+                    return buf.decode("utf-8").strip()
+        if self._append_response(buf, pending):
+            return buf.decode("utf-8").strip()
+        raise OllamaStreamError("stream ended before the response was complete")
+
+    async def _collect(self, response: httpx.Response, extract) -> str:
+        """Join the text extracted from each streamed chat chunk until done."""
+        parts = []
+        async for line in response.aiter_lines():
+            chunk = self._decode_chunk(line)
+            if chunk is None:
+                continue
+            parts.append(extract(chunk))
+            if chunk.get("done"):
+                return "".join(parts).strip()
+        raise OllamaStreamError("stream ended before the response was complete")
+
+    async def generate(self, prompt: str, system_prompt: str = "", max_tokens: int = 1000, temperature: float = 0.0,
+                       no_cache: bool = False) -> str:
+        """Async counterpart of OllamaClient.generate()."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
-            return response.status_code == 200
-        except Exception:
-            return False
+            cache_key, cached = self._cached_response("generate", temperature, no_cache,
+                                                      system_prompt, prompt, max_tokens)
+            if cached is not None:
+                return cached
+
+            payload = self._generate_payload(prompt, system_prompt, max_tokens, temperature)
+
+            async with self._client.stream("POST", "/api/generate", content=orjson.dumps(payload),
+                                           headers=_JSON_HEADERS) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    return f"ERROR: Ollama request failed with status {response.status_code}: {response.text}"
+
+                result = await self._generate_text(response)
+
+            return self._store_response(cache_key, result)
+
+        except OllamaStreamError as e:
+            return f"ERROR: Ollama stream failed: {e}"
+        except httpx.HTTPError as e:
+            return f"ERROR: Failed to connect to Ollama: {e}"
+        except orjson.JSONDecodeError as e:
+            return f"ERROR: Failed to parse Ollama response: {e}"
+        except Exception as e:
+            return f"ERROR: Unexpected error: {e}"
+
+    async def chat(self, messages: list, max_tokens: int = 1000, temperature: float = 0.0, no_cache: bool = False) -> str:
+        """Async counterpart of OllamaClient.chat()."""
+        try:
+            cache_key, cached = self._cached_response("chat", temperature, no_cache,
+                                                      orjson.dumps(messages).decode(), max_tokens)
+            if cached is not None:
+                return cached
+
+            payload = self._chat_payload(messages, max_tokens, temperature)
+
+            async with self._client.stream("POST", "/api/chat", content=orjson.dumps(payload),
+                                           headers=_JSON_HEADERS) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    return f"ERROR: Ollama chat request failed with status {response.status_code}: {response.text}"
+
+                result = await self._collect(response, lambda chunk: chunk.get("message", {}).get("content", ""))
+
+            return self._store_response(cache_key, result)
+
+        except OllamaStreamError as e:
+            return f"ERROR: Ollama stream failed: {e}"
+        except httpx.HTTPError as e:
+            return f"ERROR: Failed to connect to Ollama: {e}"
+        except orjson.JSONDecodeError as e:
+            return f"ERROR: Failed to parse Ollama response: {e}"
+        except Exception as e:
+            return f"ERROR: Unexpected error: {e}"
 
 def create_ollama_call(system_prompt: str = "") -> callable:
     """
@@ -190,7 +491,7 @@ def test_ollama_connection():
 
     # Test generation
     print("🧪 Testing generation...")
-    test_response = client.generate("Say 'Hello from Ollama!' and nothing else.")
+    test_response = client.generate("Say 'Hello from Ollama!' and nothing else.", no_cache=True)
     print(f"🤖 Response: {test_response}")
 
     if "ERROR" in test_response:
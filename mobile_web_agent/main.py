@@ -24,7 +24,10 @@ def main():
     )
 
     # Run agent
-    result = agent.run_agent(args.goal, max_steps=args.steps)
+    try:
+        result = agent.run_agent(args.goal, max_steps=args.steps)
+    finally:
+        agent.ollama.close()
 
     print(f"\\n🎉 Final Result: {result}")
 
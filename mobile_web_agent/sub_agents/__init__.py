@@ -2,6 +2,6 @@
 
 from .coordinator import SubAgentCoordinator
 from .specialist_factory import SpecialistFactory
-from .prd_parser import PRDParser
+from .prd_parser import PRDParser, ParsedPRD
 
-__all__ = ["SubAgentCoordinator", "SpecialistFactory", "PRDParser"]
\ No newline at end of file
+__all__ = ["SubAgentCoordinator", "SpecialistFactory", "PRDParser", "ParsedPRD"]
\ No newline at end of file
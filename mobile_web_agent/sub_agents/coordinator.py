@@ -8,6 +8,23 @@ if TYPE_CHECKING:
     from ..core.agent import MobileWebAgent
 
 
+# (ParsedPRD field, specialist type, summary label, task template, ParsedPRD context field)
+SPECIALIST_SPECS = (
+    ("entities", "database_specialist", "Database",
+     "Create database schema with tables: {}. Include proper relationships, constraints, and security policies.",
+     "database_schema"),
+    ("components", "frontend_specialist", "Frontend",
+     "Build React components: {}. Use TypeScript, Tailwind CSS, and mobile-first responsive design.",
+     "component_specs"),
+    ("workflows", "workflow_specialist", "Workflows",
+     "Implement user workflows: {}. Create navigation, routing, and user journey flows.",
+     "workflow_specs"),
+    ("api_endpoints", "api_specialist", "API",
+     "Create API endpoints: {}. Implement CRUD operations with proper validation and error handling.",
+     "api_specs"),
+)
+
+
 class SubAgentCoordinator:
     """Coordinates sub-agent delegation and integration."""
 
@@ -21,45 +38,25 @@ class SubAgentCoordinator:
         try:
             # Read PRD file
             prd_content = self.main_agent.file_ops.read_file(prd_path)
-            if "ERROR" in prd_content:
+            if prd_content.startswith("ERROR"):
                 return f"Failed to read PRD: {prd_content}"
 
-            # Parse PRD to extract components
-            entities = self.prd_parser.extract_entities(prd_content)
-            components = self.prd_parser.extract_components(prd_content)
-            workflows = self.prd_parser.extract_workflows(prd_content)
-            api_endpoints = self.prd_parser.extract_api_endpoints(prd_content)
+            # Parse PRD once to extract requirements and section contexts
+            parsed = self.prd_parser.parse(prd_content)
 
             # Create focused sub-agent tasks
             sub_tasks = []
-
-            if entities:
-                sub_tasks.append({
-                    "type": "database_specialist",
-                    "task": f"Create database schema with tables: {', '.join(entities)}. Include proper relationships, constraints, and security policies.",
-                    "context": self.prd_parser.extract_database_schema(prd_content)
-                })
-
-            if components:
-                sub_tasks.append({
-                    "type": "frontend_specialist",
-                    "task": f"Build React components: {', '.join(components)}. Use TypeScript, Tailwind CSS, and mobile-first responsive design.",
-                    "context": self.prd_parser.extract_component_specs(prd_content)
-                })
-
-            if workflows:
-                sub_tasks.append({
-                    "type": "workflow_specialist",
-                    "task": f"Implement user workflows: {', '.join(workflows)}. Create navigation, routing, and user journey flows.",
-                    "context": self.prd_parser.extract_workflow_specs(prd_content)
-                })
-
-            if api_endpoints:
-                sub_tasks.append({
-                    "type": "api_specialist",
-                    "task": f"Create API endpoints: {', '.join(api_endpoints)}. Implement CRUD operations with proper validation and error handling.",
-                    "context": self.prd_parser.extract_api_specs(prd_content)
-                })
+            summary_lines = []
+
+            for field_name, agent_type, label, task_template, context_field in SPECIALIST_SPECS:
+                values = getattr(parsed, field_name)
+                summary_lines.append(f"- {label}: {'✅' if values else '⏭️'}")
+                if values:
+                    sub_tasks.append({
+                        "type": agent_type,
+                        "task": task_template.format(', '.join(values)),
+                        "context": getattr(parsed, context_field)
+                    })
 
             # Always add testing specialist
             sub_tasks.append({
@@ -81,18 +78,18 @@ class SubAgentCoordinator:
                 )
                 results.append(f"{task_spec['type']}: {result}")
 
+            results_text = "\n".join(results)
+            summary_text = "\n".join(summary_lines)
+
             return f"""
 Sub-agent delegation completed:
 
 Tasks Created: {len(sub_tasks)}
-- Database: {'✅' if entities else '⏭️'}
-- Frontend: {'✅' if components else '⏭️'}
-- Workflows: {'✅' if workflows else '⏭️'}
-- API: {'✅' if api_endpoints else '⏭️'}
+{summary_text}
 - Testing: ✅
 
 Results:
-{chr(10).join(results)}
+{results_text}
 
 Ready for integration and deployment.
 """
@@ -1,134 +1,201 @@
 """PRD parsing utilities for extracting development requirements."""
 
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+_COMPONENT_KEYWORDS = ("component", "card", "form", "list", "dashboard", "builder")
+
+
+@dataclass
+class ParsedPRD:
+    """Requirements and section text extracted from a PRD in a single pass."""
+    entities: List[str] = field(default_factory=list)
+    components: List[str] = field(default_factory=list)
+    workflows: List[str] = field(default_factory=list)
+    api_endpoints: List[str] = field(default_factory=list)
+    database_schema: str = ""
+    component_specs: str = ""
+    workflow_specs: str = ""
+    api_specs: str = ""
+
+
+class _SectionCollector:
+    """Collects one section's lines, line by line, so several sections can share a scan."""
+
+    def __init__(self, marker: str, keyword: str):
+        self.marker = marker
+        self.keyword = keyword
+        self.lines: List[str] = []
+        self.in_section = False
+        self.done = False
+
+    def feed(self, line: str, lower: str) -> None:
+        # Lines repeating the marker are skipped, even inside the section; the section
+        # ends at the first '##' heading that no longer mentions the keyword.
+        if self.done:
+            return
+        if self.marker in lower:
+            self.in_section = True
+        elif line.startswith('##') and self.in_section and self.keyword not in lower:
+            self.done = True
+        elif self.in_section:
+            self.lines.append(line)
+
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+
+class _EntityCollector:
+    """Collects database table entities line by line."""
+
+    def __init__(self):
+        self.entities: List[str] = []
+        self.in_database_section = False
+
+    def feed(self, line: str, lower: str) -> None:
+        if "database schema" in lower or "### users table" in lower:
+            self.in_database_section = True
+        elif line.startswith('##') and self.in_database_section:
+            self.in_database_section = False
+        elif self.in_database_section and "### " in line and "table" in lower:
+            entity = line.replace("###", "").replace("Table", "").strip()
+            self.entities.append(entity)
+
+
+def _schema_section() -> _SectionCollector:
+    return _SectionCollector("database schema", "database")
+
+
+def _component_section() -> _SectionCollector:
+    return _SectionCollector("ui component", "component")
+
+
+def _api_section() -> _SectionCollector:
+    return _SectionCollector("api endpoint", "api")
 
 
 class PRDParser:
     """Parses PRD content to extract development requirements."""
 
     @staticmethod
-    def extract_entities(prd_content: str) -> List[str]:
-        """Extract database entities from PRD."""
-        entities = []
-        lines = prd_content.split('\n')
-        in_database_section = False
+    def parse(prd_content: str) -> ParsedPRD:
+        """Parse PRD in one line scan, collecting every requirement list and section."""
+        parsed = ParsedPRD()
+        entities = _EntityCollector()
+        schema, component_specs, api_specs = _schema_section(), _component_section(), _api_section()
+        workflow_lines = []
 
-        for line in lines:
-            if "database schema" in line.lower() or "### users table" in line.lower():
-                in_database_section = True
-            elif line.startswith('##') and in_database_section:
-                in_database_section = False
-            elif in_database_section and "### " in line and "table" in line.lower():
-                entity = line.replace("###", "").replace("Table", "").strip()
-                entities.append(entity)
+        for line in prd_content.split('\n'):
+            lower = line.lower()
+            entities.feed(line, lower)
+            schema.feed(line, lower)
+            component_specs.feed(line, lower)
+            api_specs.feed(line, lower)
+
+            component = PRDParser._component_name(line, lower)
+            if component is not None:
+                parsed.components.append(component)
+            if PRDParser._is_workflow(lower):
+                parsed.workflows.append(PRDParser._workflow_name(line))
+                workflow_lines.append(line)
+            endpoint = PRDParser._endpoint(line)
+            if endpoint is not None:
+                parsed.api_endpoints.append(endpoint)
+
+        parsed.entities = entities.entities
+        parsed.database_schema = schema.text()
+        parsed.component_specs = component_specs.text()
+        parsed.workflow_specs = '\n'.join(workflow_lines)
+        parsed.api_specs = api_specs.text()
+        return parsed
+
+    @staticmethod
+    def _component_name(line: str, lower: str) -> Optional[str]:
+        """Return the bold component name on line, if it names a UI component."""
+        if "**" in line and any(keyword in lower for keyword in _COMPONENT_KEYWORDS):
+            # Extract component name between ** markers
+            parts = line.split("**")
+            if len(parts) >= 2:
+                return parts[1].split(":")[0].strip()
+        return None
 
-        return entities
+    @staticmethod
+    def _is_workflow(lower: str) -> bool:
+        return "flow:" in lower or "journey" in lower
+
+    @staticmethod
+    def _workflow_name(line: str) -> str:
+        return line.replace("###", "").replace(":", "").strip()
+
+    @staticmethod
+    def _endpoint(line: str) -> Optional[str]:
+        """Return the first backticked /api/ endpoint on line, if any."""
+        if "`/api/" in line:
+            # Extract endpoint pattern
+            start = line.find("`") + 1
+            end = line.find("`", start)
+            if end > start:
+                return line[start:end]
+        return None
+
+    @staticmethod
+    def extract_entities(prd_content: str) -> List[str]:
+        """Extract database entities from PRD."""
+        collector = _EntityCollector()
+        for line in prd_content.split('\n'):
+            collector.feed(line, line.lower())
+        return collector.entities
 
     @staticmethod
     def extract_components(prd_content: str) -> List[str]:
         """Extract UI components from PRD."""
         components = []
-        lines = prd_content.split('\n')
-
-        for line in lines:
-            if "**" in line and any(keyword in line.lower() for keyword in ["component", "card", "form", "list", "dashboard", "builder"]):
-                # Extract component name between ** markers
-                parts = line.split("**")
-                if len(parts) >= 2:
-                    component = parts[1].split(":")[0].strip()
-                    components.append(component)
-
+        for line in prd_content.split('\n'):
+            component = PRDParser._component_name(line, line.lower())
+            if component is not None:
+                components.append(component)
         return components
 
     @staticmethod
     def extract_workflows(prd_content: str) -> List[str]:
         """Extract user workflows from PRD."""
-        workflows = []
-        lines = prd_content.split('\n')
-
-        for line in lines:
-            if "flow:" in line.lower() or "journey" in line.lower():
-                workflow = line.replace("###", "").replace(":", "").strip()
-                workflows.append(workflow)
-
-        return workflows
+        return [PRDParser._workflow_name(line) for line in prd_content.split('\n')
+                if PRDParser._is_workflow(line.lower())]
 
     @staticmethod
     def extract_api_endpoints(prd_content: str) -> List[str]:
         """Extract API endpoints from PRD."""
         endpoints = []
-        lines = prd_content.split('\n')
-
-        for line in lines:
-            if "`/api/" in line:
-                # Extract endpoint pattern
-                start = line.find("`") + 1
-                end = line.find("`", start)
-                if end > start:
-                    endpoint = line[start:end]
-                    endpoints.append(endpoint)
-
+        for line in prd_content.split('\n'):
+            endpoint = PRDParser._endpoint(line)
+            if endpoint is not None:
+                endpoints.append(endpoint)
         return endpoints
 
     @staticmethod
-    def extract_database_schema(prd_content: str) -> str:
-        """Extract database schema section from PRD."""
-        lines = prd_content.split('\n')
-        in_schema = False
-        schema_lines = []
-
-        for line in lines:
-            if "database schema" in line.lower():
-                in_schema = True
-            elif line.startswith('##') and in_schema and "database" not in line.lower():
+    def _extract_section(prd_content: str, collector: _SectionCollector) -> str:
+        for line in prd_content.split('\n'):
+            if collector.done:
                 break
-            elif in_schema:
-                schema_lines.append(line)
+            collector.feed(line, line.lower())
+        return collector.text()
 
-        return '\n'.join(schema_lines)
+    @staticmethod
+    def extract_database_schema(prd_content: str) -> str:
+        """Extract database schema section from PRD."""
+        return PRDParser._extract_section(prd_content, _schema_section())
 
     @staticmethod
     def extract_component_specs(prd_content: str) -> str:
         """Extract component specifications from PRD."""
-        lines = prd_content.split('\n')
-        in_components = False
-        component_lines = []
-
-        for line in lines:
-            if "ui component" in line.lower():
-                in_components = True
-            elif line.startswith('##') and in_components and "component" not in line.lower():
-                break
-            elif in_components:
-                component_lines.append(line)
-
-        return '\n'.join(component_lines)
+        return PRDParser._extract_section(prd_content, _component_section())
 
     @staticmethod
     def extract_workflow_specs(prd_content: str) -> str:
         """Extract workflow specifications from PRD."""
-        lines = prd_content.split('\n')
-        workflow_lines = []
-
-        for line in lines:
-            if "flow:" in line.lower() or "journey" in line.lower():
-                workflow_lines.append(line)
-
-        return '\n'.join(workflow_lines)
+        return '\n'.join(line for line in prd_content.split('\n') if PRDParser._is_workflow(line.lower()))
 
     @staticmethod
     def extract_api_specs(prd_content: str) -> str:
         """Extract API specifications from PRD."""
-        lines = prd_content.split('\n')
-        in_api = False
-        api_lines = []
-
-        for line in lines:
-            if "api endpoint" in line.lower():
-                in_api = True
-            elif line.startswith('##') and in_api and "api" not in line.lower():
-                break
-            elif in_api:
-                api_lines.append(line)
-
-        return '\n'.join(api_lines)
\ No newline at end of file
+        return PRDParser._extract_section(prd_content, _api_section())
@@ -23,7 +23,8 @@ class SpecialistFactory:
             sub_agent = MobileWebAgent(
                 work_directory=str(self.main_agent.work_dir),
                 model=self.main_agent.model,
-                verbose=False  # Keep sub-agents quiet
+                verbose=False,  # Keep sub-agents quiet
+                ollama=self.main_agent.ollama  # Reuse warm Ollama connection
             )
 
             # NO tool restrictions - full agent capabilities!
@@ -75,8 +76,7 @@ class SpecialistFactory:
                 action = sub_agent.clean_json(raw_resp)
 
                 if not isinstance(action, dict) or "action" not in action:
-                    history.append({"role": "assistant", "content": raw_resp})
-                    history.append({"role": "tool", "content": "Response must be valid JSON with 'action' field."})
+                    sub_agent.record_exchange(history, raw_resp, "Response must be valid JSON with 'action' field.")
                     continue
 
                 tool_name = action["action"]
@@ -84,8 +84,7 @@ class SpecialistFactory:
 
                 if tool_name not in sub_agent.tools:
                     error_msg = f"Tool not available: {tool_name}. Available: {list(sub_agent.tools.keys())[:10]}..."
-                    history.append({"role": "assistant", "content": raw_resp})
-                    history.append({"role": "tool", "content": error_msg})
+                    sub_agent.record_exchange(history, raw_resp, error_msg)
                     continue
 
                 # Execute tool
@@ -94,8 +93,7 @@ class SpecialistFactory:
                 except Exception as e:
                     result = f"Tool execution error: {e}"
 
-                history.append({"role": "assistant", "content": raw_resp})
-                history.append({"role": "tool", "content": result})
+                sub_agent.record_exchange(history, raw_resp, result)
 
             return f"Task incomplete after {max_steps} steps"
 
@@ -0,0 +1,78 @@
+"""Shared Lighthouse audit runner for the mobile and testing tools."""
+
+from typing import Iterable, Optional, Tuple, TYPE_CHECKING
+
+import orjson
+
+if TYPE_CHECKING:
+    from ..core.file_operations import FileOperations
+
+
+DEFAULT_URL = "http://localhost:3000"
+REPORT_PATH = "lighthouse-mobile.json"
+
+# Every run covers these so the responsive and performance audits can share one Chromium boot
+MOBILE_CATEGORIES = ("performance", "accessibility")
+
+
+def _parse_report(content: str) -> Tuple[Optional[dict], str]:
+    try:
+        return orjson.loads(content), ""
+    except orjson.JSONDecodeError as e:
+        return None, f"ERROR: Failed to parse Lighthouse report: {e}"
+
+
+def _reusable_report(file_ops: "FileOperations", categories: Tuple[str, ...], url: str) -> Optional[dict]:
+    """Return the last report if no file has changed since it was written and it covers categories."""
+    try:
+        if (file_ops.work_dir / REPORT_PATH).stat().st_mtime <= file_ops.last_modified:
+            return None
+    except OSError:
+        return None
+
+    report, _ = _parse_report(file_ops.read_file(REPORT_PATH))
+    if report is None or report.get("requestedUrl", "").rstrip("/") != url.rstrip("/"):
+        return None
+    if not set(categories) <= report.get("categories", {}).keys():
+        return None
+    return report
+
+
+def _run_report(file_ops: "FileOperations", categories: Tuple[str, ...], url: str) -> Tuple[Optional[dict], str]:
+    """Return a report covering categories, running Lighthouse only if the last one is stale."""
+    report = _reusable_report(file_ops, categories, url)
+    if report is not None:
+        return report, ""
+
+    audit_categories = sorted(set(categories).union(MOBILE_CATEGORIES))
+    output = file_ops.run_bash(
+        f"npm exec -- lighthouse --only-categories={','.join(audit_categories)} --form-factor=mobile "
+        f"--chrome-flags='--headless' --output=json --output-path=./{REPORT_PATH} {url}"
+    )
+    if output.startswith("ERROR") or "Return code:" in output:
+        return None, output
+
+    content = file_ops.read_file(REPORT_PATH)
+    if content.startswith("ERROR"):
+        return None, f"{output}\n{content}"
+    return _parse_report(content)
+
+
+def run_lighthouse_audit(file_ops: "FileOperations", categories: Iterable[str], url: str = DEFAULT_URL) -> str:
+    """Audit url on a mobile form factor and summarize the requested category scores.
+
+    The report on disk is reused while no file has been written, edited or touched by a
+    shell command since it was produced, so back-to-back audits boot Chromium once.
+    """
+    requested = tuple(categories)
+    report, error = _run_report(file_ops, requested, url)
+    if report is None:
+        return error
+
+    lines = [f"Lighthouse mobile audit for {url}:"]
+    report_categories = report.get("categories", {})
+    for category in requested:
+        score = report_categories.get(category, {}).get("score")
+        lines.append(f"- {category}: {round(score * 100)}/100" if score is not None else f"- {category}: n/a")
+    lines.append(f"Full report: {REPORT_PATH}")
+    return "\n".join(lines)
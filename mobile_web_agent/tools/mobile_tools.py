@@ -1,51 +1,40 @@
 """Mobile web development tools."""
 
-import json
+from string import Template
 from typing import TYPE_CHECKING
 
+import orjson
+
+from .lighthouse import run_lighthouse_audit
+
 if TYPE_CHECKING:
     from ..core.file_operations import FileOperations
 
 
-class MobileTools:
-    """Tools for mobile web development."""
-
-    def __init__(self, file_ops: "FileOperations"):
-        self.file_ops = file_ops
-
-    def create_pwa_manifest(self, app_name: str, description: str = "Mobile Web Application") -> str:
-        """Create PWA manifest.json file."""
-        manifest = {
-            "name": app_name,
-            "short_name": app_name,
-            "description": description,
-            "start_url": "/",
-            "display": "standalone",
-            "background_color": "#0ea5e9",
-            "theme_color": "#0ea5e9",
-            "orientation": "portrait-primary",
-            "icons": [
-                {
-                    "src": "/icon-192x192.png",
-                    "sizes": "192x192",
-                    "type": "image/png"
-                },
-                {
-                    "src": "/icon-512x512.png",
-                    "sizes": "512x512",
-                    "type": "image/png"
-                }
-            ]
+# Static manifest fields; create_pwa_manifest only fills in the app name and description
+_MANIFEST_BASE = {
+    "start_url": "/",
+    "display": "standalone",
+    "background_color": "#0ea5e9",
+    "theme_color": "#0ea5e9",
+    "orientation": "portrait-primary",
+    "icons": [
+        {
+            "src": "/icon-192x192.png",
+            "sizes": "192x192",
+            "type": "image/png"
+        },
+        {
+            "src": "/icon-512x512.png",
+            "sizes": "512x512",
+            "type": "image/png"
         }
+    ]
+}
 
-        content = json.dumps(manifest, indent=2)
-        return self.file_ops.write_file("public/manifest.json", content)
-
-    def create_service_worker(self) -> str:
-        """Create basic service worker for PWA."""
-        sw_content = """
+_SW_JS = """
 // Service Worker for Mobile Web App PWA
-const CACHE_NAME = 'mobile-app-v1';
+const CACHE_NAME = 'mobile-app-v3';
 const urlsToCache = [
   '/',
   '/static/js/bundle.js',
@@ -54,56 +43,49 @@ const urlsToCache = [
 ];
 
 self.addEventListener('install', event => {
+  // Cache each asset independently so one missing file does not abort the install
   event.waitUntil(
     caches.open(CACHE_NAME)
-      .then(cache => cache.addAll(urlsToCache))
+      .then(cache => Promise.allSettled(urlsToCache.map(url => cache.add(url))))
   );
+  self.skipWaiting();
 });
 
-self.addEventListener('fetch', event => {
-  event.respondWith(
-    caches.match(event.request)
-      .then(response => {
-        if (response) {
-          return response;
-        }
-        return fetch(event.request);
-      })
+self.addEventListener('activate', event => {
+  event.waitUntil(
+    caches.keys()
+      .then(names => Promise.all(
+        names.filter(name => name !== CACHE_NAME).map(name => caches.delete(name))
+      ))
+      .then(() => self.clients.claim())
   );
 });
-"""
-        return self.file_ops.write_file("public/sw.js", sw_content.strip())
 
-    def create_responsive_component(self, component_name: str, props: str = "") -> str:
-        """Create a responsive React component template."""
-        component_content = f"""
-import React from 'react';
+self.addEventListener('fetch', event => {
+  const url = new URL(event.request.url);
+  // Only same-origin static assets are cached; API calls and other origins go straight to the network
+  if (event.request.method !== 'GET' || url.origin !== self.location.origin || url.pathname.startsWith('/api/')) {
+    return;
+  }
 
-interface {component_name}Props {{
-  {props}
-}}
+  // Stale-while-revalidate: answer from cache immediately, refresh it from the network
+  const fetched = fetch(event.request);
+  const network = fetched.then(response => response.clone());
+  const refresh = fetched
+    .then(response => response.ok && caches.open(CACHE_NAME).then(cache => cache.put(event.request, response)))
+    .catch(() => {});
 
-const {component_name}: React.FC<{component_name}Props> = (props) => {{
-  return (
-    <div className="w-full max-w-md mx-auto p-4 sm:max-w-lg md:max-w-xl lg:max-w-2xl">
-      <div className="bg-white rounded-lg shadow-md p-6">
-        <h2 className="text-xl font-bold text-gray-900 mb-4">
-          {component_name}
-        </h2>
-        {{/* Component content here */}}
-      </div>
-    </div>
+  // Keep the worker alive until the cache refresh has been written
+  event.waitUntil(refresh);
+  event.respondWith(
+    caches.open(CACHE_NAME)
+      .then(cache => cache.match(event.request))
+      .then(cached => cached || network)
   );
-}};
-
-export default {component_name};
-"""
-        return self.file_ops.write_file(f"src/components/{component_name}.tsx", component_content.strip())
+});
+""".strip()
 
-    def setup_tailwind(self) -> str:
-        """Set up Tailwind CSS for the project."""
-        # Tailwind config
-        config_content = """
+_TAILWIND_CONFIG_JS = """
 /** @type {import('tailwindcss').Config} */
 module.exports = {
   content: [
@@ -121,11 +103,9 @@ module.exports = {
   },
   plugins: [],
 }
-"""
-        result1 = self.file_ops.write_file("tailwind.config.js", config_content.strip())
+""".strip()
 
-        # CSS file
-        css_content = """
+_INDEX_CSS = """
 @tailwind base;
 @tailwind components;
 @tailwind utilities;
@@ -145,42 +125,93 @@ module.exports = {
     @apply bg-white rounded-lg shadow-md p-6 border border-gray-200;
   }
 }
-"""
-        result2 = self.file_ops.write_file("src/index.css", css_content.strip())
+""".strip()
 
-        return f"{result1}\\n{result2}"
+# Resource hints live in the HTML shell so the browser sees them before any JS runs.
+# (attribute that identifies an existing tag, tag); no CSS preload, since Create React
+# App fingerprints the stylesheet name and already links it from the built index.html.
+_HEAD_HINTS = (
+    ('name="viewport"', '<meta name="viewport" content="width=device-width,initial-scale=1,viewport-fit=cover" />'),
+    ('name="theme-color"', '<meta name="theme-color" content="#0ea5e9" />'),
+    ('href="https://fonts.googleapis.com"', '<link rel="preconnect" href="https://fonts.googleapis.com" crossorigin />'),
+    ('rel="manifest"', '<link rel="manifest" href="/manifest.json" />'),
+)
 
-    def create_mobile_layout(self, layout_name: str) -> str:
-        """Create mobile-first layout component."""
-        layout_content = f"""
+_INDEX_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8" />
+    ${hints}
+    <title>Mobile App</title>
+  </head>
+  <body>
+    <noscript>You need to enable JavaScript to run this app.</noscript>
+    <div id="root"></div>
+  </body>
+</html>
+""".strip().replace("${hints}", "\n    ".join(tag for _, tag in _HEAD_HINTS))
+
+_COMPONENT_TPL = Template("""
 import React from 'react';
 
-interface {layout_name}Props {{
+interface ${name}Props {
+  ${props}
+}
+
+const ${name}: React.FC<${name}Props> = (props) => {
+  return (
+    <div className="w-full max-w-md mx-auto p-4 sm:max-w-lg md:max-w-xl lg:max-w-2xl">
+      <div className="bg-white rounded-lg shadow-md p-6">
+        <h2 className="text-xl font-bold text-gray-900 mb-4">
+          ${name}
+        </h2>
+        {/* Component content here */}
+      </div>
+    </div>
+  );
+};
+
+export default ${name};
+""".strip())
+
+_LAYOUT_TPL = Template("""
+import React, { Suspense } from 'react';
+
+interface ${name}Props {
   children: React.ReactNode;
   title?: string;
-}}
+}
+
+// Memoized so the static icon is not re-rendered on every layout update
+const MenuIcon = React.memo(() => (
+  <svg className="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+    <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M4 6h16M4 12h16M4 18h16" />
+  </svg>
+));
 
-const {layout_name}: React.FC<{layout_name}Props> = ({{ children, title }}) => {{
+const ${name}: React.FC<${name}Props> = ({ children, title }) => {
   return (
     <div className="min-h-screen bg-gray-50">
-      {{/* Mobile Header */}}
+      {/* Mobile Header */}
       <header className="bg-primary text-white p-4 sticky top-0 z-10">
         <div className="flex items-center justify-between">
-          <h1 className="text-lg font-bold">{{title || 'Mobile App'}}</h1>
+          <h1 className="text-lg font-bold">{title || 'Mobile App'}</h1>
           <button className="p-2 hover:bg-blue-600 rounded">
-            <svg className="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={{2}} d="M4 6h16M4 12h16M4 18h16" />
-            </svg>
+            <MenuIcon />
           </button>
         </div>
       </header>
 
-      {{/* Main Content */}}
+      {/* Main Content: lazy routes render the fallback while their chunk loads, e.g.
+          const Feature = React.lazy(() => import('./Feature')); */}
       <main className="pb-16 sm:pb-0">
-        {{children}}
+        <Suspense fallback={<div className="p-4">Loading...</div>}>
+          {children}
+        </Suspense>
       </main>
 
-      {{/* Mobile Bottom Navigation */}}
+      {/* Mobile Bottom Navigation */}
       <nav className="fixed bottom-0 left-0 right-0 bg-white border-t border-gray-200 sm:hidden">
         <div className="grid grid-cols-4 py-2">
           <button className="flex flex-col items-center p-2 text-primary">
@@ -199,12 +230,70 @@ const {layout_name}: React.FC<{layout_name}Props> = ({{ children, title }}) => {
       </nav>
     </div>
   );
-}};
+};
+
+export default ${name};
+""".strip())
+
+
+class MobileTools:
+    """Tools for mobile web development."""
+
+    def __init__(self, file_ops: "FileOperations"):
+        self.file_ops = file_ops
+
+    def create_pwa_manifest(self, app_name: str, description: str = "Mobile Web Application") -> str:
+        """Create PWA manifest.json file."""
+        manifest = {
+            "name": app_name,
+            "short_name": app_name,
+            "description": description,
+            **_MANIFEST_BASE
+        }
+
+        content = orjson.dumps(manifest, option=orjson.OPT_INDENT_2).decode()
+        return self.file_ops.write_file("public/manifest.json", content)
+
+    def create_service_worker(self) -> str:
+        """Create stale-while-revalidate service worker for PWA."""
+        return self.file_ops.write_file("public/sw.js", _SW_JS)
+
+    def create_responsive_component(self, component_name: str, props: str = "") -> str:
+        """Create a responsive React component template."""
+        return self.file_ops.write_file(f"src/components/{component_name}.tsx", _COMPONENT_TPL.substitute(name=component_name, props=props))
+
+    def setup_tailwind(self) -> str:
+        """Set up Tailwind CSS for the project."""
+        return self.file_ops.write_files([
+            ("tailwind.config.js", _TAILWIND_CONFIG_JS),
+            ("src/index.css", _INDEX_CSS)
+        ])
+
+    def create_mobile_layout(self, layout_name: str) -> str:
+        """Create mobile-first layout component and add its resource hints to public/index.html."""
+        result = self.file_ops.write_file(f"src/components/{layout_name}.tsx", _LAYOUT_TPL.substitute(name=layout_name))
+        return f"{result}\n{self._add_head_hints()}"
+
+    def _add_head_hints(self) -> str:
+        """Write the HTML shell if absent, otherwise add only the hints its <head> lacks."""
+        html = self.file_ops.read_file("public/index.html")
+        if html.startswith("ERROR"):
+            return self.file_ops.write_file("public/index.html", _INDEX_HTML)
+
+        missing = [tag for marker, tag in _HEAD_HINTS if marker not in html]
+        if not missing:
+            return "public/index.html already has the mobile resource hints"
+        head_end = html.find("</head>")
+        if head_end == -1:
+            return "Skipped public/index.html: no </head> to add resource hints to"
 
-export default {layout_name};
-"""
-        return self.file_ops.write_file(f"src/components/{layout_name}.tsx", layout_content.strip())
+        # Match the indentation of the closing tag when it sits on its own line
+        indent = html[html.rfind("\n", 0, head_end) + 1:head_end]
+        if indent.strip():
+            indent = ""
+        hints = "".join(f"{'  ' if indent else ''}{tag}\n{indent}" for tag in missing)
+        return self.file_ops.write_file("public/index.html", f"{html[:head_end]}{hints}{html[head_end:]}")
 
     def test_mobile_responsive(self) -> str:
         """Test mobile responsiveness using Lighthouse."""
-        return self.file_ops.run_bash("npx lighthouse --only-categories=performance,accessibility --form-factor=mobile --chrome-flags='--headless' http://localhost:3000")
\ No newline at end of file
+        return run_lighthouse_audit(self.file_ops, ("performance", "accessibility"))
\ No newline at end of file
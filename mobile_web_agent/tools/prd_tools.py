@@ -1,8 +1,9 @@
 """PRD-driven development tools."""
 
-import json
 from typing import TYPE_CHECKING
 
+import orjson
+
 if TYPE_CHECKING:
     from ..core.file_operations import FileOperations
 
@@ -18,15 +19,15 @@ class PRDTools:
         """Load PRD file and initialize progress tracking."""
         try:
             content = self.file_ops.read_file(prd_path)
-            if "ERROR" in content:
+            if content.startswith("ERROR"):
                 return content
 
             # Basic PRD loading
-            return json.dumps({
+            return orjson.dumps({
                 "status": "loaded",
                 "path": prd_path,
                 "content_length": len(content)
-            })
+            }).decode()
         except Exception as e:
             return f"ERROR loading PRD: {e}"
 
@@ -37,10 +38,10 @@ class PRDTools:
 
     def validate_against_prd(self, project_path: str = ".") -> str:
         """Validate current implementation against PRD requirements."""
-        return json.dumps({
+        return orjson.dumps({
             "validation": "pending",
             "message": "PRD validation - integrate with actual tracker"
-        })
+        }).decode()
 
     def mark_progress(self, entity: str, aspect: str, completed: bool = True) -> str:
         """Mark progress on implementation."""
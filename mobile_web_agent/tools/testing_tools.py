@@ -1,24 +1,28 @@
 """Testing framework tools."""
 
+from concurrent.futures import ThreadPoolExecutor
+from string import Template
 from typing import TYPE_CHECKING
 
+from .lighthouse import run_lighthouse_audit
+
 if TYPE_CHECKING:
     from ..core.file_operations import FileOperations
 
 
-class TestingTools:
-    """Tools for setting up and running tests."""
-
-    def __init__(self, file_ops: "FileOperations"):
-        self.file_ops = file_ops
-
-    def setup_jest(self) -> str:
-        """Set up Jest testing framework."""
-        jest_config = """
+_JEST_CONFIG = """
 module.exports = {
   testEnvironment: 'jsdom',
   setupFilesAfterEnv: ['<rootDir>/src/setupTests.ts'],
-  moduleNameMapping: {
+  // SWC transpiles TS and JS far faster than ts-jest or babel-jest (requires @swc/jest and @swc/core).
+  // Setting transform replaces babel-jest entirely, so it must cover every extension testMatch does.
+  transform: {
+    '^.+\\\\.(t|j)sx?$': ['@swc/jest'],
+  },
+  maxWorkers: '50%',
+  cache: true,
+  cacheDirectory: '<rootDir>/.jest-cache',
+  moduleNameMapper: {
     '\\\\.(css|less|scss|sass)$': 'identity-obj-proxy',
   },
   testMatch: [
@@ -39,28 +43,26 @@ module.exports = {
     }
   }
 };
-"""
+""".strip()
 
-        setup_tests = """
+_SETUP_TESTS = """
 import '@testing-library/jest-dom';
-"""
-
-        result1 = self.file_ops.write_file("jest.config.js", jest_config.strip())
-        result2 = self.file_ops.write_file("src/setupTests.ts", setup_tests.strip())
-
-        return f"{result1}\\n{result2}"
+""".strip()
 
-    def setup_playwright(self) -> str:
-        """Set up Playwright for E2E testing."""
-        playwright_config = """
+_PLAYWRIGHT_CONFIG = """
 import { defineConfig, devices } from '@playwright/test';
 
 export default defineConfig({
   testDir: './tests/e2e',
+  // Slow specs are skipped by default; add a project without testIgnore to run them
+  testIgnore: /.*\\.slow\\.spec\\.ts/,
   fullyParallel: true,
   forbidOnly: !!process.env.CI,
   retries: process.env.CI ? 2 : 0,
-  workers: process.env.CI ? 1 : undefined,
+  // '50%' scales with the runner's CPU count instead of serializing CI
+  workers: process.env.CI ? '50%' : undefined,
+  // Split across CI runners with `npx playwright test --shard=<index>/<total>`, or pin it here:
+  // shard: { current: 1, total: 4 },
   reporter: 'html',
   use: {
     baseURL: 'http://localhost:3000',
@@ -85,44 +87,12 @@ export default defineConfig({
   webServer: {
     command: 'npm start',
     url: 'http://localhost:3000',
-    reuseExistingServer: !process.env.CI,
+    reuseExistingServer: !process.env.CI || !!process.env.PLAYWRIGHT_REUSE_SERVER,
   },
 });
-"""
-        return self.file_ops.write_file("playwright.config.ts", playwright_config.strip())
+""".strip()
 
-    def create_unit_tests(self, component_name: str) -> str:
-        """Create unit tests for a component."""
-        test_content = f"""
-import React from 'react';
-import {{ render, screen, fireEvent }} from '@testing-library/react';
-import {component_name} from '../{component_name}';
-
-describe('{component_name}', () => {{
-  it('renders without crashing', () => {{
-    render(<{component_name} />);
-    expect(screen.getByText('{component_name}')).toBeInTheDocument();
-  }});
-
-  it('handles user interactions correctly', () => {{
-    render(<{component_name} />);
-    // Add specific interaction tests here
-  }});
-
-  it('displays correct data when props are provided', () => {{
-    const testProps = {{
-      // Add test props here
-    }};
-    render(<{component_name} {{...testProps}} />);
-    // Add assertions here
-  }});
-}});
-"""
-        return self.file_ops.write_file(f"src/components/__tests__/{component_name}.test.tsx", test_content.strip())
-
-    def create_integration_tests(self) -> str:
-        """Create integration tests."""
-        test_content = """
+_INTEGRATION_TEST = """
 import React from 'react';
 import { render, screen, waitFor } from '@testing-library/react';
 import userEvent from '@testing-library/user-event';
@@ -147,12 +117,9 @@ describe('App Integration Tests', () => {
     // Add form testing logic
   });
 });
-"""
-        return self.file_ops.write_file("src/__tests__/App.integration.test.tsx", test_content.strip())
+""".strip()
 
-    def create_e2e_tests(self) -> str:
-        """Create end-to-end tests with Playwright."""
-        e2e_content = """
+_E2E_TEST = """
 import { test, expect } from '@playwright/test';
 
 test.describe('Mobile App E2E Tests', () => {
@@ -176,23 +143,91 @@ test.describe('Mobile App E2E Tests', () => {
     await expect(page.getByText('Mobile App')).toBeVisible();
   });
 });
-"""
-        return self.file_ops.write_file("tests/e2e/mobile-app.spec.ts", e2e_content.strip())
+""".strip()
+
+_UNIT_TEST_TPL = Template("""
+import React from 'react';
+import { render, screen, fireEvent } from '@testing-library/react';
+import ${name} from '../${name}';
+
+describe('${name}', () => {
+  it('renders without crashing', () => {
+    render(<${name} />);
+    expect(screen.getByText('${name}')).toBeInTheDocument();
+  });
+
+  it('handles user interactions correctly', () => {
+    render(<${name} />);
+    // Add specific interaction tests here
+  });
+
+  it('displays correct data when props are provided', () => {
+    const testProps = {
+      // Add test props here
+    };
+    render(<${name} {...testProps} />);
+    // Add assertions here
+  });
+});
+""".strip())
 
-    def run_all_tests(self) -> str:
-        """Run all test suites."""
-        results = []
 
-        # Run unit tests
-        results.append("=== UNIT TESTS ===")
-        results.append(self.file_ops.run_bash("npm test -- --coverage --watchAll=false"))
+class TestingTools:
+    """Tools for setting up and running tests."""
 
-        # Run E2E tests
-        results.append("\\n=== E2E TESTS ===")
-        results.append(self.file_ops.run_bash("npx playwright test"))
+    def __init__(self, file_ops: "FileOperations"):
+        self.file_ops = file_ops
 
-        return "\\n".join(results)
+    def setup_jest(self) -> str:
+        """Set up Jest testing framework."""
+        return self.file_ops.write_files([
+            ("jest.config.js", _JEST_CONFIG),
+            ("src/setupTests.ts", _SETUP_TESTS)
+        ])
+
+    def setup_playwright(self) -> str:
+        """Set up Playwright for E2E testing."""
+        return self.file_ops.write_file("playwright.config.ts", _PLAYWRIGHT_CONFIG)
+
+    def create_unit_tests(self, component_name: str) -> str:
+        """Create unit tests for a component."""
+        return self.file_ops.write_file(f"src/components/__tests__/{component_name}.test.tsx", _UNIT_TEST_TPL.substitute(name=component_name))
+
+    def create_integration_tests(self) -> str:
+        """Create integration tests."""
+        return self.file_ops.write_file("src/__tests__/App.integration.test.tsx", _INTEGRATION_TEST)
+
+    def create_e2e_tests(self) -> str:
+        """Create end-to-end tests with Playwright."""
+        return self.file_ops.write_file("tests/e2e/mobile-app.spec.ts", _E2E_TEST)
+
+    def run_all_tests(self, parallel: bool = True) -> str:
+        """Run all test suites.
+
+        With parallel=True, Jest and Playwright run at the same time. This is safe
+        because unit tests never bind the dev server's port 3000. Pass
+        parallel=False if a custom unit setup does.
+        """
+        unit_cmd = "npm test -- --coverage --watchAll=false"
+        e2e_cmd = "npx playwright test"
+
+        if parallel:
+            # Jest is CPU-bound while Playwright mostly waits on Chromium, so they overlap well
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                unit_future = executor.submit(self.file_ops.run_bash, unit_cmd)
+                e2e_future = executor.submit(self.file_ops.run_bash, e2e_cmd)
+                unit_result, e2e_result = unit_future.result(), e2e_future.result()
+        else:
+            unit_result = self.file_ops.run_bash(unit_cmd)
+            e2e_result = self.file_ops.run_bash(e2e_cmd)
+
+        return "\n".join([
+            "=== UNIT TESTS ===",
+            unit_result,
+            "\n=== E2E TESTS ===",
+            e2e_result
+        ])
 
     def test_mobile_performance(self) -> str:
         """Test mobile performance using Lighthouse."""
-        return self.file_ops.run_bash("npx lighthouse --only-categories=performance --form-factor=mobile --output=json --output-path=./lighthouse-mobile.json http://localhost:3000")
\ No newline at end of file
+        return run_lighthouse_audit(self.file_ops, ("performance",))
\ No newline at end of file